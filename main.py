@@ -1,10 +1,145 @@
-from rdflib import Graph, RDF, RDFS, OWL, URIRef, Literal, Namespace, BNode
-import pandas as pd
+from rdflib import Graph, RDF, RDFS, OWL, URIRef, Literal, BNode
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import importlib.util
 import os
 import re
-from transformers import AutoTokenizer
+from pathlib import Path
+
+try:
+    import pyoxigraph  # Optional Rust-backed parser, much faster than rdflib on large files
+except ImportError:
+    pyoxigraph = None
+
+# pyoxigraph.parse(path=..., format=RdfFormat...) is only available from pyoxigraph 0.4
+if pyoxigraph is not None and not hasattr(pyoxigraph, "RdfFormat"):
+    pyoxigraph = None
+
+# Word tokenizer shared by the textual metrics
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+# XSD datatypes are never inferred as classes
+_XSD_PREFIX = "http://www.w3.org/2001/XMLSchema#"
+_XSD_STRING = _XSD_PREFIX + "string"
+_RDF_CLASS = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#Class")
+
+# Types whose subjects are explicitly declared classes
+_EXPLICIT_CLASS_TYPES = frozenset({OWL.Class, RDFS.Class, _RDF_CLASS})
+
+# OWL terms that are never inferred as classes
+_OWL_EXCLUDES = frozenset({
+    OWL.Ontology,
+    OWL.Restriction,
+    OWL.DeprecatedClass,
+    OWL.ObjectProperty,
+    OWL.TransitiveProperty,
+    OWL.DatatypeProperty,
+    OWL.FunctionalProperty,
+    OWL.DeprecatedProperty,
+    OWL.Thing,
+    OWL.Nothing,
+    OWL.AnnotationProperty,
+    OWL.SymmetricProperty,
+    OWL.InverseFunctionalProperty,
+})
+
+# Additional class exclusions
+_ADDITIONAL_EXCLUDES = frozenset({
+    URIRef("http://www.w3.org/2000/01/rdf-schema#Class"),
+    URIRef("http://www.w3.org/2002/07/owl#Class"),
+    URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#Property"),
+})
+
+# RDFS terms that are never inferred as classes
+_RDFS_EXCLUDES = frozenset({RDFS.Datatype, RDFS.Resource, RDFS.Literal})
+
+# Types related to classes and properties, whose subjects are not individuals
+_EXCLUDED_TYPES = frozenset({
+    OWL.Class, OWL.ObjectProperty, OWL.AnnotationProperty, OWL.DatatypeProperty,
+    OWL.Ontology, OWL.Restriction, OWL.FunctionalProperty, OWL.DeprecatedProperty,
+    OWL.InverseFunctionalProperty, OWL.SymmetricProperty, OWL.TransitiveProperty,
+    OWL.onDatatype, OWL.DeprecatedClass, RDF.Property, RDFS.Datatype, RDFS.Class
+})
+
+# Properties to be explicitly excluded from the property metrics
+_EXCLUDED_PREDICATES = frozenset({
+    URIRef("http://www.w3.org/2000/01/rdf-schema#subClassOf"),
+    RDF.type
+})
+
+def parse_with_oxigraph(g, file_path):
+    """
+    Parses a Turtle file with pyoxigraph and adds its triples to an rdflib graph.
+
+    Only pyoxigraph's parser is used: its Store rewrites typed literals into a canonical form
+    (e.g. "1.0"^^xsd:decimal and "1.00"^^xsd:decimal both become "1"), which would change the metrics.
+    The parser keeps the lexical forms, so the graph holds the same triples as with rdflib's own parser, with one
+    exception: pyoxigraph reports plain literals as xsd:string (RDF 1.1), so "x" and "x"^^xsd:string are the same
+    term here while rdflib keeps them apart. A subject with both on the same predicate yields one triple, not two.
+
+    :param g: rdflib graph to fill.
+    :param file_path: Path to the TTL file.
+    """
+    iris = {}  # IRIs repeat across many triples, convert each one once while parsing
+
+    def to_rdflib(term):
+        if isinstance(term, pyoxigraph.NamedNode):
+            iri = iris.get(term.value)
+            if iri is None:
+                iri = iris[term.value] = URIRef(term.value)
+            return iri
+        if isinstance(term, pyoxigraph.BlankNode):
+            return BNode(term.value)
+        if term.language:
+            return Literal(term.value, lang=term.language)
+        if term.datatype.value == _XSD_STRING:
+            return Literal(term.value)
+        return Literal(term.value, datatype=to_rdflib(term.datatype))
+
+    triples = pyoxigraph.parse(
+        path=file_path,
+        format=pyoxigraph.RdfFormat.TURTLE,
+        base_iri=Path(file_path).absolute().as_uri(),
+    )
+    g.addN((to_rdflib(t.subject), to_rdflib(t.predicate), to_rdflib(t.object), g) for t in triples)
 
-def identify_classes(g):
+def load_graph(file_path):
+    """
+    Loads a Turtle file into an rdflib graph.
+    Parses with pyoxigraph when it is installed and with rdflib otherwise, or when pyoxigraph fails on the file.
+    Both parsers produce the same graph except that pyoxigraph merges "x" with "x"^^xsd:string
+    (see parse_with_oxigraph), which can lower the triple, literal and property counts for such files.
+
+    :param file_path: Path to the TTL file.
+    :return: rdflib Graph.
+    """
+    # Since rdflib 6 (required, see the README) "Memory" is the indexed in-memory store that replaced IOMemory
+    if pyoxigraph is not None:
+        g = Graph(store="Memory")
+        try:
+            parse_with_oxigraph(g, file_path)
+            return g
+        except Exception as e:
+            print(f"pyoxigraph could not parse {file_path}, falling back to rdflib: {e}")
+
+    g = Graph(store="Memory")
+    g.parse(file_path, format="turtle")
+    return g
+
+def index_types_by_subject(g):
+    """
+    Indexes the rdf:type assertions of the graph by subject in a single pass.
+
+    :param g: RDF graph.
+    :return: Dictionary with subjects as keys and the set of their types as values.
+    """
+    types_by_subject = defaultdict(set)
+    for s, _, o in g.triples((None, RDF.type, None)):
+        types_by_subject[s].add(o)
+    return types_by_subject
+
+def identify_classes(types_by_subject):
     """
     Identifies all resources that can be considered classes.
     Prioritizes explicit classes and only infers classes if no explicit ones are found.
@@ -12,67 +147,42 @@ def identify_classes(g):
 
     Excludes certain RDF, RDFS, and OWL entities from being identified as classes.
 
-    :param g: RDF graph.
+    :param types_by_subject: Types of each subject as returned by index_types_by_subject.
     :return: Dictionary with classes as keys and identification details as values.
     """
     classes = {}
-    XSD = Namespace("http://www.w3.org/2001/XMLSchema#")
-    RDF_CLASS = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#Class")
-
-    # OWL terms to exclude
-    OWL_EXCLUDES = {
-        OWL.Ontology,
-        OWL.Restriction,
-        OWL.DeprecatedClass,
-        OWL.ObjectProperty,
-        OWL.TransitiveProperty,
-        OWL.DatatypeProperty,
-        OWL.FunctionalProperty,
-        OWL.DeprecatedProperty,
-        OWL.Thing,
-        OWL.Nothing,
-        OWL.AnnotationProperty,
-        OWL.SymmetricProperty,
-        OWL.InverseFunctionalProperty,
-    }
 
-    # Additional exclusions
-    ADDITIONAL_EXCLUDES = {
-        URIRef("http://www.w3.org/2000/01/rdf-schema#Class"),
-        URIRef("http://www.w3.org/2002/07/owl#Class"),
-        URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#Property"),
-    }
-
-    # 1. Detect explicit classes via RDF.type OWL.Class
-    for s, p, o in g.triples((None, RDF.type, OWL.Class)):
-        if s not in ADDITIONAL_EXCLUDES:
-            classes[s] = {"type": "explicit (RDF.type OWL.Class)"}
-
-    # 2. Detect explicit classes via RDF.type RDFS.Class
-    for s, p, o in g.triples((None, RDF.type, RDFS.Class)):
-        if s not in ADDITIONAL_EXCLUDES:
-            classes[s] = {"type": "explicit (RDF.type RDFS.Class)"}
-
-    # 3. Detect explicit classes via RDF.type rdf:Class
-    for s, p, o in g.triples((None, RDF.type, RDF_CLASS)):
-        if s not in ADDITIONAL_EXCLUDES:
-            classes[s] = {"type": "explicit (RDF.type rdf:Class)"}
-
-    # 4. Infer classes from Turtle syntax (resources after 'a')
-    for s, p, o in g.triples((None, RDF.type, None)):
+    # Buckets filled in a single pass over the rdf:type assertions
+    explicit = {OWL.Class: {}, RDFS.Class: {}, _RDF_CLASS: {}}
+    inferred = {}
+
+    for s, types in types_by_subject.items():
+        for o in types:
+            if o in _EXPLICIT_CLASS_TYPES:
+                # 1-3. Detect explicit classes via RDF.type OWL.Class, RDFS.Class or rdf:Class
+                if s not in _ADDITIONAL_EXCLUDES and not isinstance(s, BNode):
+                    if o == OWL.Class:
+                        explicit[o][s] = {"type": "explicit (RDF.type OWL.Class)"}
+                    elif o == RDFS.Class:
+                        explicit[o][s] = {"type": "explicit (RDF.type RDFS.Class)"}
+                    else:
+                        explicit[o][s] = {"type": "explicit (RDF.type rdf:Class)"}
+
+            # 4. Infer classes from Turtle syntax (resources after 'a')
+            if (o in _OWL_EXCLUDES or
+                o in _ADDITIONAL_EXCLUDES or
+                o.startswith(_XSD_PREFIX) or  # rdflib terms are str subclasses, no str() copy needed
+                o in _RDFS_EXCLUDES or
+                isinstance(o, BNode)):
+                continue  # Skip OWL exclusions, XSD datatypes, RDFS exclusions and blank nodes
+            inferred[o] = {"type": "inferred (Turtle 'a')"}
+
+    # Merge buckets: rdf:Class overrides RDFS.Class overrides OWL.Class, explicit overrides inferred
+    for declared in (explicit[OWL.Class], explicit[RDFS.Class], explicit[_RDF_CLASS]):
+        classes.update(declared)
+    for o, details in inferred.items():
         if o not in classes:  # Only add if not explicitly defined as a class
-            if (o in OWL_EXCLUDES or 
-                o in ADDITIONAL_EXCLUDES or
-                str(o).startswith(str(XSD)) or 
-                o in {RDFS.Datatype, RDFS.Resource, RDFS.Literal}):
-                continue  # Skip OWL exclusions, XSD datatypes, and RDFS exclusions
-            classes[o] = {"type": "inferred (Turtle 'a')"}
-    
-    # Remove classes that are of type BNode
-    for cls in list(classes.keys()):
-        if isinstance(cls, BNode):
-            del classes[cls]
-    
+            classes[o] = details
 
     return classes
 
@@ -80,25 +190,19 @@ def calculate_totals_and_densities(concept_properties, g, n_classes):
     """
     Calculates the total, unique number of properties and densities.
 
-    :param concept_properties: Dictionary with properties associated with each concept.
+    :param concept_properties: Dictionary with the property counts (Counter) associated with each concept.
     :param g: RDF graph.
     :param n_classes: Total number of classes.
     :return: Dictionary with calculated metrics.
     """
-    all_object_properties = set()
-    all_data_annotation_properties = set()
+    object_counters = [properties["object_properties"] for properties in concept_properties.values()]
+    data_annotation_counters = [properties["data_annotation_properties"] for properties in concept_properties.values()]
 
-    for properties in concept_properties.values():
-        for prop in properties["object_properties"]:
-            all_object_properties.add(prop)
+    total_object_properties_unique = len(set().union(*object_counters))
+    total_data_annotation_properties_unique = len(set().union(*data_annotation_counters))
 
-        all_data_annotation_properties.update(properties["data_annotation_properties"])
-
-    total_object_properties_unique = len(all_object_properties)
-    total_data_annotation_properties_unique = len(all_data_annotation_properties)
-
-    total_object_properties = sum(len(properties["object_properties"]) for properties in concept_properties.values())
-    total_data_annotation_properties = sum(len(properties["data_annotation_properties"]) for properties in concept_properties.values())
+    total_object_properties = sum(sum(counter.values()) for counter in object_counters)
+    total_data_annotation_properties = sum(sum(counter.values()) for counter in data_annotation_counters)
 
     # Densities
     property_density = (total_object_properties + total_data_annotation_properties) / n_classes if n_classes > 0 else 0
@@ -116,56 +220,111 @@ def calculate_totals_and_densities(concept_properties, g, n_classes):
     }
     return results
 
-def list_properties_by_concept(file_path):
+def iterate_properties(g, classes, individuals, excluded_predicates):
     """
-    Lists the properties (Object Properties and Data/Annotation Properties) associated with each concept in a Turtle file.
+    Associates the properties (Object Properties and Data/Annotation Properties) of the graph with
+    concepts and individuals in a single scan over the triples.
+    The same scan tokenizes every literal object to gather the word statistics used by extract_textual_metrics.
 
-    :param file_path: Path to the TTL file.
-    :return: Dictionary with concepts as keys and their differentiated properties as values.
+    For concepts, only IRI objects are Object Properties; for individuals, blank node objects are too.
+
+    :param g: RDF graph.
+    :param classes: Dictionary of classes as returned by identify_classes.
+    :param individuals: Set of individuals as returned by identify_individuals.
+    :param excluded_predicates: Properties to be explicitly excluded.
+    :return: Tuple with the property counts by concept, the property counts by individual, the individual property totals
+             and the literal word statistics.
     """
-    # Load the TTL file into a graph
-    g = Graph()
-    g.parse(file_path, format="turtle")
+    # Dictionaries to store property counts by concept and by individual
+    def new_entry():
+        return {"object_properties": Counter(), "data_annotation_properties": Counter()}
 
-    # Identify classes in the graph
-    classes = identify_classes(g)
+    concept_properties = defaultdict(new_entry)
+    individual_properties = defaultdict(new_entry)
 
-    # Properties to be explicitly excluded
-    excluded_object_properties = {
-        URIRef("http://www.w3.org/2000/01/rdf-schema#subClassOf"),
-        RDF.type
-    }
+    # Counters to calculate proportions
+    totals = {"total_object_properties": 0, "total_data_properties": 0}
 
-    # Dictionary to store properties by concept
-    concept_properties = {}
+    # Running word statistics of the literals
+    total_literals = 0
+    total_words = 0
+    longest_literal = 0
+    shortest_literal = None
+    vocabulary = set()
 
-    # Iterate over the triples and associate properties with concepts
+    # Iterate over the triples and associate properties with concepts and individuals
     for s, p, o in g.triples((None, None, None)):
-        if s in classes:
-            if s not in concept_properties:
-                concept_properties[s] = {
-                    "object_properties": [],
-                    "data_annotation_properties": []
-                }
+        if isinstance(o, Literal):
+            # Tokenize literals and count words with running reductions
+            tokenized = _TOKEN_RE.findall(o)
+            word_count = len(tokenized)
+            total_literals += 1
+            total_words += word_count
+            if word_count > longest_literal:
+                longest_literal = word_count
+            if shortest_literal is None or word_count < shortest_literal:
+                shortest_literal = word_count
+            vocabulary.update(word.lower() for word in tokenized)
+
+        is_concept = s in classes
+        is_individual = s in individuals
+        if not (is_concept or is_individual):
+            continue
+
+        is_iri = isinstance(o, URIRef)
+        excluded = p in excluded_predicates
+
+        if is_concept:
+            entry = concept_properties[s]
 
             # Identify the type of property based on the nature of the object (o)
-            if isinstance(o, URIRef) and p not in excluded_object_properties:
-                # If the object is a resource (IRI) and is not in the excluded properties, it is an Object Property
-                concept_properties[s]["object_properties"].append(p)
-            elif not isinstance(o, URIRef) and p not in excluded_object_properties:
-                # If the object is a literal, it is a Data/Annotation Property
-                concept_properties[s]["data_annotation_properties"].append(p)
+            if not excluded:
+                if is_iri:
+                    # If the object is a resource (IRI), it is an Object Property
+                    entry["object_properties"][p] += 1
+                else:
+                    # If the object is a literal, it is a Data/Annotation Property
+                    entry["data_annotation_properties"][p] += 1
+
+        if is_individual:
+            entry = individual_properties[s]
+
+            if not excluded:
+                if is_iri or isinstance(o, BNode):
+                    # If the object is a resource (IRI or blank node), it is an Object Property
+                    entry["object_properties"][p] += 1
+                    totals["total_object_properties"] += 1
+                else:
+                    # If the object is a literal, it is a Data/Annotation Property
+                    entry["data_annotation_properties"][p] += 1
+                    totals["total_data_properties"] += 1
+
+    literal_stats = {
+        "total_literals": total_literals,
+        "total_words": total_words,
+        "longest_literal": longest_literal,
+        "shortest_literal": shortest_literal,
+        "vocabulary": vocabulary,
+    }
 
-    # Convert property sets to lists for easier readability
+    return dict(concept_properties), dict(individual_properties), totals, literal_stats
 
+def list_properties_by_concept(concept_properties, classes):
+    """
+    Lists the properties (Object Properties and Data/Annotation Properties) associated with each concept.
+
+    :param concept_properties: Properties by concept as returned by iterate_properties.
+    :param classes: Dictionary of classes as returned by identify_classes.
+    :return: Dictionary with concepts as keys and their differentiated properties as values.
+    """
     return {
         concept: {
             "type": classes[concept]["type"],  # Add the class type to the result
-            "object_properties": list(properties["object_properties"]),
-            "data_annotation_properties": list(properties["data_annotation_properties"]),
+            "object_properties": properties["object_properties"],
+            "data_annotation_properties": properties["data_annotation_properties"],
         }
         for concept, properties in concept_properties.items()
-    }, classes
+    }
 
 def count_subclasses_and_average(g, total_classes):
     """
@@ -184,15 +343,18 @@ def count_subclasses_and_average(g, total_classes):
 
     return {"total_subclasses": total_subclasses, "average_subclasses_per_class": average_subclasses}
 
-def extract_textual_metrics(g):
+def extract_textual_metrics(literal_stats):
     """
     Extracts textual metrics from the dataset, focusing on literal objects.
 
-    :param g: RDF graph.
+    :param literal_stats: Literal word statistics as returned by iterate_properties.
     :return: Dictionary with textual metrics.
     """
-    literals = [o for s, p, o in g.triples((None, None, None)) if isinstance(o, Literal)]
-    total_literals = len(literals)
+    total_literals = literal_stats["total_literals"]
+    total_words = literal_stats["total_words"]
+    longest_literal = literal_stats["longest_literal"]
+    shortest_literal = literal_stats["shortest_literal"]
+    vocabulary = literal_stats["vocabulary"]
 
     if total_literals == 0:
         return {
@@ -203,19 +365,7 @@ def extract_textual_metrics(g):
             "Vocabulary Size in Literals": 0,
         }
 
-    # Tokenize literals and count words
-    words = []
-    word_counts = []
-    for literal in literals:
-        tokenized = re.findall(r'\b\w+\b', str(literal))
-        words.extend(tokenized)
-        word_counts.append(len(tokenized))
-
-    total_words = len(words)
     average_words_per_literal = total_words / total_literals
-    longest_literal = max(word_counts)
-    shortest_literal = min(word_counts)
-    vocabulary = set(word.lower() for word in words)
     vocabulary_size = len(vocabulary)
 
     return {
@@ -234,13 +384,14 @@ def calculate_global_text_metrics(file_path):
     :param file_path: Path to the TTL file.
     :return: Dictionary with global text metrics.
     """
+    # Tokenize words in the raw text line by line, so the file is never held in memory
+    total_words = 0
+    vocabulary = set()
     with open(file_path, "r", encoding="utf-8") as file:
-        raw_text = file.read()
-
-    # Tokenize words in the raw text
-    words = re.findall(r'\b\w+\b', raw_text)
-    total_words = len(words)
-    vocabulary = set(word.lower() for word in words)
+        for line in file:
+            words = _TOKEN_RE.findall(line)
+            total_words += len(words)
+            vocabulary.update(word.lower() for word in words)
     vocabulary_size = len(vocabulary)
 
     return {
@@ -255,7 +406,7 @@ def count_annotation_properties(g):
     :param g: RDF graph.
     :return: Total number of annotation properties.
     """
-    return sum(1 for _ in g.triples((None, RDF.type, OWL.AnnotationProperty)))
+    return sum(1 for _ in g.subjects(RDF.type, OWL.AnnotationProperty))
 
 def count_datatype_properties(g):
     """
@@ -264,7 +415,7 @@ def count_datatype_properties(g):
     :param g: RDF graph.
     :return: Total number of datatype properties.
     """
-    return sum(1 for _ in g.triples((None, RDF.type, OWL.DatatypeProperty)))
+    return sum(1 for _ in g.subjects(RDF.type, OWL.DatatypeProperty))
 
 
 def count_object_properties(g):
@@ -274,133 +425,60 @@ def count_object_properties(g):
     :param g: RDF graph.
     :return: Total number of object properties.
     """
-    return sum(1 for _ in g.triples((None, RDF.type, OWL.ObjectProperty)))
+    return sum(1 for _ in g.subjects(RDF.type, OWL.ObjectProperty))
 
 
-def count_individuals(g):
+def find_ontology_root(g):
     """
-    Counts all individuals explicitly defined as owl:NamedIndividual and those defined as `a prefix:Class`,
-    excluding those defined as `a owl:Class`, intermediate objects (e.g., blank nodes), or the ontology root.
-    
+    Detects the root URI of the ontology.
+
     :param g: RDF graph.
-    :return: Total number of individuals.
+    :return: Subject defined as owl:Ontology, or None if there is none.
     """
-    individuals = set()
+    # Assume there is only one subject defined as owl:Ontology
+    return next(g.subjects(RDF.type, OWL.Ontology), None)
 
-    # Detect the root URI of the ontology
-    ontology_root = None
-    for s, p, o in g.triples((None, RDF.type, OWL.Ontology)):
-        ontology_root = s
-        break  # Assume there is only one subject defined as owl:Ontology
+def identify_individuals(types_by_subject, ontology_root):
+    """
+    Identifies all individuals explicitly defined as owl:NamedIndividual and those defined as `a prefix:Class`,
+    excluding those defined as `a owl:Class`, intermediate objects (e.g., blank nodes), or the ontology root.
 
-    # Exclude types related to classes and properties
-    excluded_types = {
-        OWL.Class, OWL.ObjectProperty, OWL.AnnotationProperty, OWL.DatatypeProperty,
-        OWL.Ontology, OWL.Restriction, OWL.FunctionalProperty, OWL.DeprecatedProperty,
-        OWL.InverseFunctionalProperty, OWL.SymmetricProperty, OWL.TransitiveProperty,
-        OWL.onDatatype, OWL.DeprecatedClass, RDF.Property, RDFS.Datatype, RDFS.Class
+    :param types_by_subject: Types of each subject as returned by index_types_by_subject.
+    :param ontology_root: Root URI of the ontology, as returned by find_ontology_root.
+    :return: Set of individuals.
+    """
+    # Individuals defined as owl:NamedIndividual or as `a prefix:Class` but not `a owl:Class`.
+    # Every owl:NamedIndividual is a typed subject, so a single pass over the type index covers both.
+    individuals = {
+        s for s, types in types_by_subject.items()
+        if not isinstance(s, BNode)  # Filter out blank nodes
+        and s != ontology_root
+        and _EXCLUDED_TYPES.isdisjoint(types)  # None of the subject's types are in _EXCLUDED_TYPES
     }
 
-    def is_valid_individual(uri):
-        """Checks if a URI can be considered a valid individual."""
-        if ontology_root and uri == ontology_root:
-            return False
-        # Verify that none of the subject's types are in excluded_types
-        for _, _, obj in g.triples((uri, RDF.type, None)):
-            if obj in excluded_types:
-                return False
-        return True
-
-    # Explicitly defined individuals as owl:NamedIndividual
-    for s, p, o in g.triples((None, RDF.type, OWL.NamedIndividual)):
-        if not isinstance(s, BNode) and is_valid_individual(s):  # Filter out blank nodes and invalid individuals
-            individuals.add(s)
-
-    # Individuals defined as `a prefix:Class` but not `a owl:Class`
-    for s, p, o in g.triples((None, RDF.type, None)):
-        if not isinstance(s, BNode) and is_valid_individual(s):
-            individuals.add(s)
+    return individuals
 
+def count_individuals(individuals):
+    """
+    Counts all individuals identified in the ontology.
+
+    :param individuals: Set of individuals as returned by identify_individuals.
+    :return: Total number of individuals.
+    """
     return len(individuals)
 
-def list_properties_by_individual(file_path):
+def list_properties_by_individual(individual_properties, totals, individuals):
     """
-    Lists the properties (Object Properties and Data/Annotation Properties) associated with each individual in a Turtle file.
-    Automatically detects the root URI of the ontology and excludes it from the set of individuals.
+    Lists the properties (Object Properties and Data/Annotation Properties) associated with each individual.
+    The ontology root is already excluded from the set of individuals by identify_individuals.
 
-    :param file_path: Path to the TTL file.
+    :param individual_properties: Properties by individual as returned by iterate_properties.
+    :param totals: Individual property totals as returned by iterate_properties.
+    :param individuals: Set of individuals as returned by identify_individuals.
     :return: Dictionary with individuals as keys and their differentiated properties as values, along with calculated metrics.
     """
-    # Load the TTL file into a graph
-    g = Graph()
-    g.parse(file_path, format="turtle")
-
-    # Detect the root URI of the ontology
-    ontology_root = None
-    for s, p, o in g.triples((None, RDF.type, OWL.Ontology)):
-        ontology_root = s
-        break  # Assume there is only one subject defined as owl:Ontology
-
-    # Identify individuals in the graph
-    individuals = set()
-    excluded_types = {
-        OWL.Class, OWL.ObjectProperty, OWL.AnnotationProperty, OWL.DatatypeProperty,
-        OWL.Ontology, OWL.Restriction, OWL.FunctionalProperty, OWL.DeprecatedProperty,
-        OWL.InverseFunctionalProperty, OWL.SymmetricProperty, OWL.TransitiveProperty,
-        OWL.onDatatype, OWL.DeprecatedClass, RDF.Property, RDFS.Datatype, RDFS.Class
-    }
-
-    def is_valid_individual(uri):
-        """Checks if a URI can be considered a valid individual."""
-        if ontology_root and uri == ontology_root:
-            return False
-        # Verify that none of the subject's types are in excluded_types
-        for _, _, obj in g.triples((uri, RDF.type, None)):
-            if obj in excluded_types:
-                return False
-        return True
-
-    # Add explicitly defined individuals as owl:NamedIndividual
-    for s, p, o in g.triples((None, RDF.type, OWL.NamedIndividual)):
-        if not isinstance(s, BNode) and is_valid_individual(s):
-            individuals.add(s)
-
-    # Add individuals defined as `a prefix:Class` but not `a owl:Class`
-    for s, p, o in g.triples((None, RDF.type, None)):
-        if o not in excluded_types and not isinstance(s, BNode) and is_valid_individual(s):
-            individuals.add(s)
-
-    # Properties to be explicitly excluded
-    excluded_object_properties = {
-        URIRef("http://www.w3.org/2000/01/rdf-schema#subClassOf"),
-        RDF.type
-    }
-
-    # Dictionary to store properties by individual
-    individual_properties = {}
-
-    # Counters to calculate proportions
-    total_object_properties = 0
-    total_data_properties = 0
-
-    # Iterate over the triples and associate properties with individuals
-    for s, p, o in g.triples((None, None, None)):
-        if s in individuals:
-            if s not in individual_properties:
-                individual_properties[s] = {
-                    "object_properties": [],
-                    "data_annotation_properties": []
-                }
-
-            # Identify the type of property based on the nature of the object (o)
-            if (isinstance(o, URIRef) or isinstance(o, BNode)) and p not in excluded_object_properties:
-                # If the object is a resource (IRI) and is not in the excluded properties, it is an Object Property
-                individual_properties[s]["object_properties"].append(p)
-                total_object_properties += 1
-            elif not isinstance(o, URIRef) and not isinstance(o, BNode) and p not in excluded_object_properties:
-                # If the object is a literal, it is a Data/Annotation Property
-                individual_properties[s]["data_annotation_properties"].append(p)
-                total_data_properties += 1
+    total_object_properties = totals["total_object_properties"]
+    total_data_properties = totals["total_data_properties"]
 
     # Calculate proportions
     num_individuals = len(individuals)
@@ -426,15 +504,23 @@ def process_ttl_file(file_path):
     """
     try:
         # Load the graph and calculate metrics
-        g = Graph()
-        g.parse(file_path, format="turtle")
+        g = load_graph(file_path)
 
         # Total number of triples in the file
         total_triples = len(g)
 
-        # Identify classes and properties
-        concept_properties, classes = list_properties_by_concept(file_path)
-        individuals_density= list_properties_by_individual(file_path)
+        # Index types and identify classes, individuals and the ontology root once for all the metrics
+        types_by_subject = index_types_by_subject(g)
+        classes = identify_classes(types_by_subject)
+        ontology_root = find_ontology_root(g)
+        individuals = identify_individuals(types_by_subject, ontology_root)
+
+        # Associate properties with classes and individuals, and gather literal statistics, in a single scan
+        concept_properties, individual_properties, individual_totals, literal_stats = iterate_properties(
+            g, classes, individuals, _EXCLUDED_PREDICATES
+        )
+        concept_properties = list_properties_by_concept(concept_properties, classes)
+        individuals_density = list_properties_by_individual(individual_properties, individual_totals, individuals)
 
         n_classes = len(classes)
         totals_and_densities = calculate_totals_and_densities(concept_properties, g, n_classes)
@@ -445,10 +531,10 @@ def process_ttl_file(file_path):
         num_annotation_properties_defined = count_annotation_properties(g)
 
         # Count individuals
-        total_individuals = count_individuals(g)
+        total_individuals = count_individuals(individuals)
 
         # Extract textual metrics from literals
-        textual_metrics = extract_textual_metrics(g)
+        textual_metrics = extract_textual_metrics(literal_stats)
 
         # Calculate global text metrics from the raw TTL file
         global_text_metrics = calculate_global_text_metrics(file_path)
@@ -490,11 +576,20 @@ def process_ttl_file(file_path):
 
 
 if __name__ == "__main__":
+    # pandas is only needed to write the results, so worker processes don't pay for importing it
+    import pandas as pd
+
     # Folder containing the TTL files
     folder_path = "./ttl/ttl"  # Change this to the actual folder path
     output_excel = "ontology_metrics.xlsx"
+    output_parquet = "ontology_metrics.parquet"
+
+    # Parquet (through pyarrow or fastparquet) is much faster to write than Excel, and xlsxwriter is faster
+    # than openpyxl. Both are optional: without a Parquet engine, checkpoints are written to Excel.
+    write_parquet = any(importlib.util.find_spec(module) is not None for module in ("pyarrow", "fastparquet"))
+    excel_engine = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") is not None else None
 
-    # Initialize an empty DataFrame
+    # Columns of the output DataFrame
     columns = [
         "File Name", "Total Triples", "Total Classes", "Total Individuals", "Total Object Properties", "Unique Object Properties",
         "Object Properties Defined",
@@ -506,23 +601,51 @@ if __name__ == "__main__":
         "Total Words in Literals", "Average Words per Literal", "Longest Literal (Words)", "Shortest Literal (Words)",
         "Vocabulary Size in Literals", "Total Words in Raw TTL File", "Vocabulary Size in Raw TTL File"
     ]
-    df = pd.DataFrame(columns=columns)
-
-    # Process each TTL file in the folder
-    for file_name in os.listdir(folder_path):
-        if file_name.endswith(".ttl"):
-            file_path = os.path.join(folder_path, file_name)
-            print(f"Processing file: {file_name}")
-            
-            # Process the file and calculate metrics
-            metrics = process_ttl_file(file_path)
-            
-            if metrics:
-                # Append the results to the DataFrame
-                df = pd.concat([df, pd.DataFrame([metrics])], ignore_index=True)
-                
-                # Save the updated DataFrame to Excel
-                df.to_excel(output_excel, index=False)
-                print(f"Metrics for {file_name} saved to {output_excel}")
-
-    print(f"Processing complete. Final results saved to {output_excel}")
\ No newline at end of file
+
+    # Number of processed files between checkpoints
+    checkpoint_every = 10
+
+    # Number of worker processes; each one holds a whole graph in memory, so lower it for very large ontologies
+    max_workers = os.cpu_count()
+
+    # Metrics of each processed file, turned into a DataFrame when saving
+    rows = []
+
+    # Each TTL file is processed independently, so distribute them over a pool of worker processes.
+    # Only file paths are sent to the workers; every worker parses its own graph.
+    file_paths = [
+        os.path.join(folder_path, file_name)
+        for file_name in os.listdir(folder_path)
+        if file_name.endswith(".ttl")
+    ]
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, metrics in zip(file_paths, executor.map(process_ttl_file, file_paths, chunksize=1)):
+                print(f"Processed file: {os.path.basename(file_path)}")
+
+                if metrics:
+                    rows.append(metrics)
+
+                    # Periodically save the results gathered so far
+                    if len(rows) % checkpoint_every == 0:
+                        checkpoint = pd.DataFrame(rows, columns=columns)
+                        if write_parquet:
+                            checkpoint.to_parquet(output_parquet, index=False)
+                            print(f"Metrics for {len(rows)} files saved to {output_parquet}")
+                        else:
+                            checkpoint.to_excel(output_excel, index=False, engine=excel_engine)
+                            print(f"Metrics for {len(rows)} files saved to {output_excel}")
+
+    except BrokenProcessPool as e:
+        # A worker died (e.g. out of memory on a large ontology); the remaining files can't be processed
+        print(f"A worker process terminated abruptly, stopping after {len(rows)} files: {e}")
+
+    finally:
+        # Save the results, even partial ones, to Parquet, when available, and once to Excel
+        df = pd.DataFrame(rows, columns=columns)
+        if write_parquet:
+            df.to_parquet(output_parquet, index=False)
+            print(f"Final results saved to {output_parquet}")
+        df.to_excel(output_excel, index=False, engine=excel_engine)
+        print(f"Processing finished. Final results saved to {output_excel}")
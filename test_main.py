@@ -0,0 +1,150 @@
+import pytest
+
+import main
+
+requires_pyoxigraph = pytest.mark.skipif(main.pyoxigraph is None, reason="pyoxigraph 0.4 or later is not installed")
+
+# Edge cases for the metric logic: explicit classes declared in several ways (rdf:Class is also inferred as a
+# class and, not being an excluded type, makes :Cat an individual), rdfs:Class itself typed as owl:Class,
+# blank node subjects and objects, a literal used as a type, and XSD/rdfs:Datatype types
+ZOO_TTL = """\
+@prefix : <http://example.org/zoo#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+<http://example.org/zoo> a owl:Ontology ; rdfs:label "Zoo ontology" .
+:Animal a owl:Class ; rdfs:label "Animal" ; rdfs:seeAlso :Dog .
+:Dog a owl:Class , rdfs:Class ; rdfs:subClassOf :Animal ; rdfs:comment "A loyal domestic animal" .
+:Cat a rdf:Class ; rdfs:subClassOf :Animal ; :shape [ :p "x" ] .
+rdfs:Class a owl:Class .
+:Keeper rdfs:label "keeper" .
+:hasKeeper a owl:ObjectProperty .
+:age a owl:DatatypeProperty , owl:FunctionalProperty .
+:note a owl:AnnotationProperty .
+:rex a owl:NamedIndividual , :Dog ; :hasKeeper :bob ; :age "3"^^xsd:integer ; :friend [ a :Cat ] .
+:bob a :Keeper ; rdfs:label "Bob" .
+:odd a "literal type" .
+_:anon a :Dog ; :age "5"^^xsd:integer .
+:Positive a rdfs:Datatype .
+:int a xsd:integer .
+"""
+
+# Typed literals whose lexical forms pyoxigraph's Store would canonicalize ("1.0" and "1.00" become "1"),
+# and a plain literal next to the same value typed as xsd:string, which pyoxigraph's parser can't tell apart
+TYPED_LITERALS_TTL = """\
+@prefix : <http://example.org/onto#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+<http://example.org/onto> a owl:Ontology ; rdfs:label "Typed literals" .
+:Thing a owl:Class ; rdfs:label "Thing"@en ; rdfs:comment "Something with values" .
+:value a owl:DatatypeProperty .
+:a a owl:NamedIndividual , :Thing ;
+    :value "1.0"^^xsd:decimal , "1.00"^^xsd:decimal , "01"^^xsd:integer , "1e0"^^xsd:double ,
+        "true"^^xsd:boolean , "1"^^xsd:boolean , "2020-01-01T00:00:00Z"^^xsd:dateTime ;
+    :note "two words" , "two words"^^xsd:string ;
+    :related :b , [ :value "nested" ] .
+:b a :Thing .
+"""
+
+
+@pytest.fixture
+def ttl_file(tmp_path):
+    path = tmp_path / "typed.ttl"
+    path.write_text(TYPED_LITERALS_TTL, encoding="utf-8")
+    return str(path)
+
+
+@requires_pyoxigraph
+def test_pyoxigraph_and_rdflib_give_the_same_metrics(ttl_file, monkeypatch):
+    with_oxigraph = main.process_ttl_file(ttl_file)
+
+    monkeypatch.setattr(main, "pyoxigraph", None)
+    with_rdflib = main.process_ttl_file(ttl_file)
+
+    assert with_oxigraph is not None
+
+    # Documented difference: pyoxigraph merges "two words" with "two words"^^xsd:string into one triple,
+    # so there is one data property on :a and two literal words fewer (2 individuals, 12 literals with rdflib)
+    string_pair_metrics = {
+        "Total Triples": (20, 19),
+        "Total Words in Literals": (26, 24),
+        "Average Words per Literal": (26 / 12, 24 / 11),
+        "Property Density by Individual": (5.0, 4.5),
+        "Data/Annotation Density by Individual": (4.0, 3.5),
+    }
+    for name, (rdflib_value, oxigraph_value) in string_pair_metrics.items():
+        assert with_rdflib.pop(name) == pytest.approx(rdflib_value)
+        assert with_oxigraph.pop(name) == pytest.approx(oxigraph_value)
+
+    # Every other metric, including those over the canonicalizable typed literals, is the same
+    assert with_oxigraph == with_rdflib
+
+
+@requires_pyoxigraph
+def test_pyoxigraph_failure_falls_back_to_rdflib(ttl_file, monkeypatch):
+    def broken_parse(*args, **kwargs):
+        raise AttributeError("module 'pyoxigraph' has no attribute 'RdfFormat'")
+
+    with monkeypatch.context() as m:
+        m.setattr(main, "pyoxigraph", None)
+        expected = main.process_ttl_file(ttl_file)
+    monkeypatch.setattr(main.pyoxigraph, "parse", broken_parse)
+
+    assert main.process_ttl_file(ttl_file) == expected
+
+
+def test_metrics_on_edge_cases(tmp_path, monkeypatch):
+    path = tmp_path / "zoo.ttl"
+    path.write_text(ZOO_TTL, encoding="utf-8")
+    monkeypatch.setattr(main, "pyoxigraph", None)
+
+    # 7 classes: Animal and Dog (owl:Class), Cat (rdf:Class), and the inferred rdf:Class, owl:NamedIndividual,
+    # Keeper and "literal type"; rdfs:Class and the XSD/rdfs:Datatype types are excluded.
+    # 5 individuals: Cat, rex, bob, odd and int; blank nodes and the ontology root are not individuals.
+    # Class properties: rdfs:seeAlso (object), 3 labels/comments and :shape to a blank node (data/annotation).
+    # Individual properties: :hasKeeper, :friend and Cat's :shape (object), rex's :age and bob's label (data).
+    # 9 literals with 14 words, e.g. "A loyal domestic animal" (4) and "x" (1), and 13 distinct lowercased words.
+    # The raw file has 153 word tokens (prefixes, IRIs and literals alike), 61 of them distinct when lowercased.
+    assert main.process_ttl_file(str(path)) == {
+        "File Name": "zoo.ttl",
+        "Total Triples": 32,
+        "Total Classes": 7,
+        "Total Individuals": 5,
+        "Total Object Properties": 1,
+        "Unique Object Properties": 1,
+        "Object Properties Defined": 1,
+        "Total Data/Annotation Properties": 4,
+        "Unique Data/Annotation Properties": 3,
+        "Property Density by Class": pytest.approx(5 / 7),
+        "Object Density by Class": pytest.approx(1 / 7),
+        "Data/Annotation Density by Class": pytest.approx(4 / 7),
+        "Property Density by Individual": pytest.approx(1.0),
+        "Object Density by Individual": pytest.approx(3 / 5),
+        "Data/Annotation Density by Individual": pytest.approx(2 / 5),
+        "Data Properties Defined": 1,
+        "Annotation Properties Defined": 1,
+        "Total Subclasses": 2,
+        "Average Subclasses per Class": pytest.approx(2 / 7),
+        "Total Words in Literals": 14,
+        "Average Words per Literal": pytest.approx(14 / 9),
+        "Longest Literal (Words)": 4,
+        "Shortest Literal (Words)": 1,
+        "Vocabulary Size in Literals": 13,
+        "Total Words in Raw TTL File": 153,
+        "Vocabulary Size in Raw TTL File": 61,
+    }
+
+
+def test_metrics_on_empty_file(tmp_path, monkeypatch):
+    path = tmp_path / "empty.ttl"
+    path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(main, "pyoxigraph", None)
+
+    metrics = main.process_ttl_file(str(path))
+
+    assert metrics.pop("File Name") == "empty.ttl"
+    assert set(metrics.values()) == {0}